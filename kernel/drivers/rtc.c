@@ -90,23 +90,27 @@ void rtc_read_time(rtc_time_t *time) {
   time->year += 2000;
 }
 
+/* Calendar lookup tables */
+static const char *const day_names[] = {"Sun", "Mon", "Tue", "Wed",
+                                        "Thu", "Fri", "Sat"};
+static const char *const month_names[] = {"",    "Jan", "Feb", "Mar", "Apr",
+                                          "May", "Jun", "Jul", "Aug", "Sep",
+                                          "Oct", "Nov", "Dec"};
+static const uint8_t month_days[] = {0,  31, 28, 31, 30, 31, 30,
+                                     31, 31, 30, 31, 30, 31};
+
 /*
  * Get day of week name
  */
-static const char *day_name(int day) {
-  const char *days[] = {"Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"};
-  return days[day % 7];
-}
+static const char *day_name(int day) { return day_names[day % 7]; }
 
 /*
  * Get month name
  */
 static const char *month_name(int month) {
-  const char *months[] = {"",    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                          "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"};
   if (month < 1 || month > 12)
     return "???";
-  return months[month];
+  return month_names[month];
 }
 
 /*
@@ -123,6 +127,28 @@ static int calc_day_of_week(int day, int month, int year) {
   return ((h + 6) % 7);
 }
 
+/*
+ * Seconds since 2000-01-01 00:00 - a clock that advances even with
+ * interrupts off, for expiring cache entries
+ */
+uint32_t rtc_get_seconds(void) {
+  rtc_time_t t;
+  rtc_read_time(&t);
+
+  uint32_t days = 0;
+  for (int y = 2000; y < t.year; y++)
+    days += (y % 4 == 0) ? 366 : 365;
+  for (int m = 1; m < t.month && m <= 12; m++) {
+    days += month_days[m];
+    if (m == 2 && t.year % 4 == 0)
+      days++;
+  }
+  if (t.day > 0)
+    days += t.day - 1;
+
+  return ((days * 24 + t.hour) * 60 + t.minute) * 60 + t.second;
+}
+
 /* ============ Shell Commands ============ */
 
 /*
@@ -167,8 +193,7 @@ void cmd_cal(const char *args) {
   int first_dow = calc_day_of_week(1, current_time.month, current_time.year);
 
   /* Days in month */
-  int days[] = {0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
-  int max_day = days[current_time.month];
+  int max_day = month_days[current_time.month];
 
   /* Leap year check */
   if (current_time.month == 2) {
@@ -27,6 +27,7 @@
 
 static int serial_initialized = 0;
 static uint16_t serial_base = COM1_BASE;
+static int serial_fifo_size = 1; /* Bytes accepted per THR-empty wait */
 
 /*
  * Initialize serial port
@@ -50,6 +51,10 @@ int serial_init(uint16_t base, int baud_divisor) {
   /* Enable FIFO, clear them, with 14-byte threshold */
   outb(serial_base + SERIAL_FIFO_CTRL, 0xC7);
 
+  /* 16550A reports working FIFOs in IIR bits 6-7 */
+  serial_fifo_size =
+      ((inb(serial_base + SERIAL_FIFO_CTRL) & 0xC0) == 0xC0) ? 16 : 1;
+
   /* IRQs enabled, RTS/DSR set */
   outb(serial_base + SERIAL_MODEM_CTRL, 0x0B);
 
@@ -88,14 +93,31 @@ void serial_putchar(char c) {
   outb(serial_base + SERIAL_DATA, c);
 }
 
+/*
+ * Queue character, waiting for the transmitter only when the FIFO is full
+ */
+static void serial_put_burst(char c, int *room) {
+  if (*room == 0) {
+    while (!serial_transmit_empty())
+      ;
+    *room = serial_fifo_size;
+  }
+  outb(serial_base + SERIAL_DATA, c);
+  (*room)--;
+}
+
 /*
  * Write string to serial
  */
 void serial_puts(const char *str) {
+  if (!serial_initialized)
+    return;
+
+  int room = 0;
   while (*str) {
     if (*str == '\n')
-      serial_putchar('\r');
-    serial_putchar(*str++);
+      serial_put_burst('\r', &room);
+    serial_put_burst(*str++, &room);
   }
 }
 
@@ -16,6 +16,7 @@ static uint16_t *vga_buffer = (uint16_t *)VGA_MEMORY;
 static int cursor_x = 0;
 static int cursor_y = 0;
 static vga_color_t current_color = VGA_COLOR_LIGHT_GREY;
+static int cursor_hw_pos = -1; /* Last position written to the CRTC */
 
 static inline uint16_t vga_entry(char c, uint8_t color) {
   return (uint16_t)c | ((uint16_t)color << 8);
@@ -27,6 +28,9 @@ static inline uint8_t vga_color_byte(vga_color_t fg, vga_color_t bg) {
 
 static void update_cursor(void) {
   uint16_t pos = cursor_y * VGA_WIDTH + cursor_x;
+  if (pos == cursor_hw_pos)
+    return;
+  cursor_hw_pos = pos;
   outb(VGA_CTRL_PORT, 0x0F);
   outb(VGA_DATA_PORT, (uint8_t)(pos & 0xFF));
   outb(VGA_CTRL_PORT, 0x0E);
@@ -54,6 +58,7 @@ void vga_init(void) {
   outb(VGA_DATA_PORT, (inb(VGA_DATA_PORT) & 0xC0) | 0);
   outb(VGA_CTRL_PORT, 0x0B);
   outb(VGA_DATA_PORT, (inb(VGA_DATA_PORT) & 0xE0) | 15);
+  cursor_hw_pos = -1; /* Hardware state unknown until first write */
   update_cursor();
 }
 
@@ -71,13 +76,8 @@ void vga_clear(void) {
 extern int pipe_is_active(void);
 extern void pipe_write_char(char c);
 
-void vga_putchar(char c) {
-  /* If pipe is capturing, send to buffer instead of screen */
-  if (pipe_is_active()) {
-    pipe_write_char(c);
-    return;
-  }
-
+/* Store character and advance cursor position (hardware cursor untouched) */
+static void vga_put_raw(char c) {
   uint8_t color = vga_color_byte(current_color, VGA_COLOR_BLACK);
 
   switch (c) {
@@ -108,14 +108,36 @@ void vga_putchar(char c) {
   if (cursor_y >= VGA_HEIGHT) {
     vga_scroll();
   }
+}
+
+void vga_putchar(char c) {
+  /* If pipe is capturing, send to buffer instead of screen */
+  if (pipe_is_active()) {
+    pipe_write_char(c);
+    return;
+  }
+
+  vga_put_raw(c);
   update_cursor();
 }
 
-void vga_puts(const char *str) {
-  while (*str)
-    vga_putchar(*str++);
+/*
+ * Write a run of characters, moving the hardware cursor once at the end
+ */
+void vga_write(const char *data, size_t len) {
+  if (pipe_is_active()) {
+    while (len--)
+      pipe_write_char(*data++);
+    return;
+  }
+
+  while (len--)
+    vga_put_raw(*data++);
+  update_cursor();
 }
 
+void vga_puts(const char *str) { vga_write(str, strlen(str)); }
+
 void vga_set_color(vga_color_t color) { current_color = color; }
 
 vga_color_t vga_get_color(void) { return current_color; }
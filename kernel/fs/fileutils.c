@@ -8,7 +8,6 @@
 
 /* External filesystem functions */
 extern int fs_write(const char *name, const char *data, size_t len);
-extern int fs_read(const char *name, char *buf, size_t max);
 
 /*
  * cp - copy file
@@ -36,23 +35,23 @@ void cmd_cp(const char *args) {
     return;
   }
 
-  /* Read source */
-  char buf[4096];
-  int len = fs_read(src, buf, sizeof(buf));
-  if (len < 0) {
+  /* Map source - copied straight from its node into the destination */
+  size_t len;
+  const uint8_t *data = fs_map(src, &len);
+  if (!data) {
     kprintf_color("Cannot read: ", VGA_COLOR_RED);
     kprintf("%s\n", src);
     return;
   }
 
   /* Write destination */
-  if (fs_write(dst, buf, len) < 0) {
+  if (fs_write(dst, (const char *)data, len) < 0) {
     kprintf_color("Cannot write: ", VGA_COLOR_RED);
     kprintf("%s\n", dst);
     return;
   }
 
-  kprintf("Copied %s -> %s (%d bytes)\n", src, dst, len);
+  kprintf("Copied %s -> %s (%d bytes)\n", src, dst, (int)len);
 }
 
 /*
@@ -80,16 +79,16 @@ void cmd_mv(const char *args) {
     return;
   }
 
-  /* Read, write, then delete original */
-  char buf[4096];
-  int len = fs_read(src, buf, sizeof(buf));
-  if (len < 0) {
+  /* Write contents to destination, then delete original */
+  size_t len;
+  const uint8_t *data = fs_map(src, &len);
+  if (!data) {
     kprintf_color("Cannot read: ", VGA_COLOR_RED);
     kprintf("%s\n", src);
     return;
   }
 
-  if (fs_write(dst, buf, len) < 0) {
+  if (fs_write(dst, (const char *)data, len) < 0) {
     kprintf_color("Cannot write: ", VGA_COLOR_RED);
     kprintf("%s\n", dst);
     return;
@@ -133,14 +132,14 @@ void cmd_head(const char *args) {
     return;
   }
 
-  char buf[4096];
-  int len = fs_read(filename, buf, sizeof(buf) - 1);
-  if (len < 0) {
+  size_t size;
+  const uint8_t *buf = fs_map(filename, &size);
+  if (!buf) {
     kprintf_color("Cannot read: ", VGA_COLOR_RED);
     kprintf("%s\n", filename);
     return;
   }
-  buf[len] = '\0';
+  int len = (int)size;
 
   /* Print first N lines */
   int lines = 0;
@@ -185,40 +184,32 @@ void cmd_tail(const char *args) {
     return;
   }
 
-  char buf[4096];
-  int len = fs_read(filename, buf, sizeof(buf) - 1);
-  if (len < 0) {
+  size_t size;
+  const uint8_t *buf = fs_map(filename, &size);
+  if (!buf) {
     kprintf_color("Cannot read: ", VGA_COLOR_RED);
     kprintf("%s\n", filename);
     return;
   }
-  buf[len] = '\0';
+  int len = (int)size;
 
-  /* Count total lines */
-  int total_lines = 0;
-  for (i = 0; i < len; i++) {
-    if (buf[i] == '\n')
-      total_lines++;
-  }
-
-  /* Find start position */
-  int skip_lines = total_lines - n;
-  if (skip_lines < 0)
-    skip_lines = 0;
+  /* Walk back from the end to the start of the Nth-from-last line */
+  int end = len;
+  if (end > 0 && buf[end - 1] == '\n')
+    end--; /* Trailing newline does not start another line */
 
+  int start = end;
   int lines = 0;
-  int start = 0;
-  for (i = 0; i < len && lines < skip_lines; i++) {
-    if (buf[i] == '\n') {
-      lines++;
-      start = i + 1;
-    }
+  while (start > 0) {
+    if (buf[start - 1] == '\n' && ++lines >= n)
+      break;
+    start--;
   }
+  if (n <= 0)
+    start = len;
 
   /* Print remaining */
-  for (i = start; i < len; i++) {
-    vga_putchar(buf[i]);
-  }
+  vga_write((const char *)buf + start, len - start);
   if (len > 0 && buf[len - 1] != '\n')
     kprintf("\n");
 }
@@ -232,14 +223,14 @@ void cmd_wc(const char *args) {
     return;
   }
 
-  char buf[4096];
-  int len = fs_read(args, buf, sizeof(buf) - 1);
-  if (len < 0) {
+  size_t size;
+  const uint8_t *buf = fs_map(args, &size);
+  if (!buf) {
     kprintf_color("Cannot read: ", VGA_COLOR_RED);
     kprintf("%s\n", args);
     return;
   }
-  buf[len] = '\0';
+  int len = (int)size;
 
   int lines = 0, words = 0, chars = len;
   int in_word = 0;
@@ -283,52 +274,49 @@ void cmd_grep(const char *args) {
     return;
   }
 
-  char buf[4096];
-  int len = fs_read(filename, buf, sizeof(buf) - 1);
-  if (len < 0) {
+  size_t size;
+  const uint8_t *buf = fs_map(filename, &size);
+  if (!buf) {
     kprintf_color("Cannot read: ", VGA_COLOR_RED);
     kprintf("%s\n", filename);
     return;
   }
-  buf[len] = '\0';
-
-  /* Search line by line */
-  char line[256];
-  int line_idx = 0;
-  int line_num = 1;
+  int len = (int)size;
+
+  /*
+   * Search the whole buffer for the pattern instead of copying each line
+   * out first. Only positions matching the pattern's first byte get a
+   * full compare; a hit prints its enclosing line and skips to the next.
+   */
+  int pat_len = strlen(pattern); /* Loop invariant */
+  char first = pattern[0];
+  int line_start = 0;
   int matches = 0;
 
-  for (i = 0; i <= len; i++) {
-    if (buf[i] == '\n' || buf[i] == '\0') {
-      line[line_idx] = '\0';
-
-      /* Simple substring search */
-      int found = 0;
-      for (int j = 0; j <= line_idx - (int)strlen(pattern); j++) {
-        int match = 1;
-        for (int k = 0; pattern[k]; k++) {
-          if (line[j + k] != pattern[k]) {
-            match = 0;
-            break;
-          }
-        }
-        if (match) {
-          found = 1;
-          break;
-        }
-      }
-
-      if (found) {
-        kprintf_color("%d:", VGA_COLOR_YELLOW);
-        kprintf("%s\n", line);
-        matches++;
-      }
-
-      line_idx = 0;
-      line_num++;
-    } else if (line_idx < 255) {
-      line[line_idx++] = buf[i];
+  i = 0;
+  while (i + pat_len <= len) {
+    if (buf[i] != first) {
+      if (buf[i] == '\n')
+        line_start = i + 1;
+      i++;
+      continue;
+    }
+    if (memcmp(buf + i, pattern, pat_len) != 0) {
+      i++;
+      continue;
     }
+
+    int line_end = i;
+    while (line_end < len && buf[line_end] != '\n')
+      line_end++;
+
+    kprintf_color("%d:", VGA_COLOR_YELLOW);
+    vga_write((const char *)buf + line_start, line_end - line_start);
+    vga_putchar('\n');
+    matches++;
+
+    /* Resume at the newline so line_start is updated for the next line */
+    i = line_end;
   }
 
   if (matches == 0) {
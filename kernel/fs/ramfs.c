@@ -17,19 +17,20 @@
 #define NODE_FILE 1
 #define NODE_DIR 2
 
-/* Filesystem node */
+/* Filesystem node - metadata only, contents live in node_data[] */
 typedef struct fs_node {
   char name[MAX_NAME];
   uint8_t type;
   int parent; /* Index of parent node (-1 for root) */
   uint32_t size;
-  uint8_t data[MAX_DATA];
+  uint8_t *data; /* Points at node_data[index] */
   uint32_t created;
   uint32_t modified;
 } fs_node_t;
 
 /* Filesystem state */
 static fs_node_t nodes[MAX_NODES];
+static uint8_t node_data[MAX_NODES][MAX_DATA];
 static int current_dir = 0; /* Index of current directory (0 = root) */
 
 /* Forward declarations */
@@ -45,6 +46,9 @@ fs_node_t *fs_get_nodes(void) { return nodes; }
  */
 int fs_init(void) {
   memset(nodes, 0, sizeof(nodes));
+  memset(node_data, 0, sizeof(node_data));
+  for (int i = 0; i < MAX_NODES; i++)
+    nodes[i].data = node_data[i];
 
   /* Create root directory */
   nodes[0].type = NODE_DIR;
@@ -182,6 +186,8 @@ static int alloc_node(void) {
   for (int i = 1; i < MAX_NODES; i++) {
     if (nodes[i].type == NODE_FREE) {
       memset(&nodes[i], 0, sizeof(fs_node_t));
+      memset(node_data[i], 0, MAX_DATA);
+      nodes[i].data = node_data[i];
       nodes[i].created = timer_get_ticks();
       nodes[i].modified = nodes[i].created;
       return i;
@@ -368,13 +374,11 @@ void cmd_ls(const char *args) {
         kprintf_color(nodes[i].name, VGA_COLOR_CYAN);
         kprintf("/\n");
       } else {
-        /* Simple format without width specifier */
-        kprintf("%s", nodes[i].name);
-        /* Pad to 20 chars */
+        /* Pad name to 20 chars (kprintf has no width specifier) */
+        static const char pad[] = "                    ";
         int len = strlen(nodes[i].name);
-        for (int p = len; p < 20; p++)
-          kprintf(" ");
-        kprintf("%d bytes\n", nodes[i].size);
+        kprintf("%s%s%d bytes\n", nodes[i].name, len < 20 ? pad + len : "",
+                nodes[i].size);
       }
       count++;
     }
@@ -407,7 +411,8 @@ void cmd_cat(const char *args) {
     return;
   }
 
-  kprintf("\n%s", (char *)nodes[idx].data);
+  kprintf("\n");
+  vga_write((const char *)nodes[idx].data, nodes[idx].size);
   if (nodes[idx].size > 0 && nodes[idx].data[nodes[idx].size - 1] != '\n') {
     kprintf("\n");
   }
@@ -527,6 +532,27 @@ int fs_write(const char *name, const char *data, size_t len) {
   return 0;
 }
 
+/*
+ * fs_append - Append to file, creating it if needed
+ */
+int fs_append(const char *name, const char *data, size_t len) {
+  int idx = resolve_path(name);
+
+  if (idx < 0)
+    return fs_write(name, data, len);
+  if (nodes[idx].type == NODE_DIR)
+    return -1;
+
+  size_t room = MAX_DATA - nodes[idx].size;
+  if (len > room)
+    len = room;
+  memcpy(nodes[idx].data + nodes[idx].size, data, len);
+  nodes[idx].size += len;
+  nodes[idx].modified = timer_get_ticks();
+
+  return 0;
+}
+
 /*
  * fs_read - Read file
  */
@@ -544,6 +570,20 @@ int fs_read(const char *name, char *buf, size_t max) {
   return len;
 }
 
+/*
+ * fs_map - Get read-only view of file contents without copying
+ * Data is not NUL-terminated; valid until the file is next written.
+ */
+const uint8_t *fs_map(const char *name, size_t *len) {
+  int idx = resolve_path(name);
+  if (idx < 0 || nodes[idx].type == NODE_DIR) {
+    return NULL;
+  }
+
+  *len = nodes[idx].size;
+  return nodes[idx].data;
+}
+
 /*
  * Echo with redirect
  */
@@ -598,6 +638,9 @@ void cmd_echo_file(const char *args) {
   /* Append newline */
   strcat(text, "\n");
 
-  fs_write(filename, text, strlen(text));
+  if (append)
+    fs_append(filename, text, strlen(text));
+  else
+    fs_write(filename, text, strlen(text));
   kprintf("Wrote to %s\n", filename);
 }
@@ -8,7 +8,6 @@
 
 /* External filesystem functions */
 extern const char *fhs_getcwd(void);
-extern int fs_read(const char *name, char *buf, size_t max);
 
 /* Simple strstr implementation */
 static char *utils_strstr(const char *haystack, const char *needle) {
@@ -82,7 +81,7 @@ typedef struct {
   uint8_t type;
   int parent;
   uint32_t size;
-  uint8_t data[4096];
+  uint8_t *data;
   uint32_t created;
   uint32_t modified;
 } fs_node_ext_t;
@@ -90,40 +89,56 @@ typedef struct {
 /* Get node array from ramfs */
 extern fs_node_ext_t *fs_get_nodes(void);
 
+/*
+ * Build per-directory child lists in one pass over the node table, so a
+ * tree walk visits each node once instead of rescanning the table for
+ * every directory. Children are linked in ascending node order.
+ */
+static void build_child_index(const fs_node_ext_t *nodes, int16_t *first_child,
+                              int16_t *next_sibling) {
+  for (int i = 0; i < MAX_NODES; i++)
+    first_child[i] = -1;
+
+  for (int i = MAX_NODES - 1; i >= 0; i--) {
+    next_sibling[i] = -1;
+    if (nodes[i].type != NODE_FREE && nodes[i].parent >= 0 &&
+        nodes[i].parent < MAX_NODES) {
+      next_sibling[i] = first_child[nodes[i].parent];
+      first_child[nodes[i].parent] = i;
+    }
+  }
+}
+
 /*
  * find - Search for files
  * Usage: find [path] -name <pattern>
  */
-static void find_recursive(int parent, const char *pattern,
-                           const char *base_path) {
-  fs_node_ext_t *nodes = fs_get_nodes();
-  if (!nodes)
-    return;
+static void find_recursive(const fs_node_ext_t *nodes,
+                           const int16_t *first_child,
+                           const int16_t *next_sibling, int parent,
+                           const char *pattern, const char *base_path) {
+  for (int i = first_child[parent]; i >= 0; i = next_sibling[i]) {
+    /* Build full path */
+    char path[256];
+    if (strcmp(base_path, "/") == 0) {
+      utils_snprintf(path, 256, "/%s", nodes[i].name);
+    } else {
+      utils_snprintf(path, 256, "%s/%s", base_path, nodes[i].name);
+    }
 
-  for (int i = 0; i < MAX_NODES; i++) {
-    if (nodes[i].type != NODE_FREE && nodes[i].parent == parent) {
-      /* Build full path */
-      char path[256];
-      if (strcmp(base_path, "/") == 0) {
-        utils_snprintf(path, 256, "/%s", nodes[i].name);
+    /* Check if name matches pattern (simple substring) */
+    if (pattern[0] == '\0' || utils_strstr(nodes[i].name, pattern)) {
+      if (nodes[i].type == NODE_DIR) {
+        kprintf_color(path, VGA_COLOR_CYAN);
+        kprintf("/\n");
       } else {
-        utils_snprintf(path, 256, "%s/%s", base_path, nodes[i].name);
-      }
-
-      /* Check if name matches pattern (simple substring) */
-      if (pattern[0] == '\0' || utils_strstr(nodes[i].name, pattern)) {
-        if (nodes[i].type == NODE_DIR) {
-          kprintf_color(path, VGA_COLOR_CYAN);
-          kprintf("/\n");
-        } else {
-          kprintf("%s\n", path);
-        }
+        kprintf("%s\n", path);
       }
+    }
 
-      /* Recurse into directories */
-      if (nodes[i].type == NODE_DIR) {
-        find_recursive(i, pattern, path);
-      }
+    /* Recurse into directories */
+    if (nodes[i].type == NODE_DIR) {
+      find_recursive(nodes, first_child, next_sibling, i, pattern, path);
     }
   }
 }
@@ -158,8 +173,15 @@ void cmd_find(const char *args) {
     pattern[i] = '\0';
   }
 
+  fs_node_ext_t *nodes = fs_get_nodes();
+  if (!nodes)
+    return;
+
+  int16_t first_child[MAX_NODES], next_sibling[MAX_NODES];
+  build_child_index(nodes, first_child, next_sibling);
+
   kprintf("\n");
-  find_recursive(0, pattern, "");
+  find_recursive(nodes, first_child, next_sibling, 0, pattern, "");
   kprintf("\n");
 }
 
@@ -235,18 +257,13 @@ void cmd_df(const char *args) {
 /*
  * du - Display directory size
  */
-static int du_recursive(int parent) {
-  fs_node_ext_t *nodes = fs_get_nodes();
-  if (!nodes)
-    return 0;
-
+static int du_recursive(const fs_node_ext_t *nodes, const int16_t *first_child,
+                        const int16_t *next_sibling, int parent) {
   int total = 0;
-  for (int i = 0; i < MAX_NODES; i++) {
-    if (nodes[i].type != NODE_FREE && nodes[i].parent == parent) {
-      total += nodes[i].size;
-      if (nodes[i].type == NODE_DIR) {
-        total += du_recursive(i);
-      }
+  for (int i = first_child[parent]; i >= 0; i = next_sibling[i]) {
+    total += nodes[i].size;
+    if (nodes[i].type == NODE_DIR) {
+      total += du_recursive(nodes, first_child, next_sibling, i);
     }
   }
   return total;
@@ -261,17 +278,24 @@ void cmd_du(const char *args) {
     return;
   }
 
+  int16_t first_child[MAX_NODES], next_sibling[MAX_NODES];
+  build_child_index(nodes, first_child, next_sibling);
+
   kprintf("\n");
 
-  /* Show size of each top-level directory */
-  for (int i = 0; i < MAX_NODES; i++) {
-    if (nodes[i].type == NODE_DIR && nodes[i].parent == 0) {
-      int size = du_recursive(i);
-      kprintf("%d\t/%s\n", size, nodes[i].name);
+  /* Show size of each top-level directory; total is their sum plus
+   * files directly under / so the tree is walked only once */
+  int total = 0;
+  for (int i = first_child[0]; i >= 0; i = next_sibling[i]) {
+    int size = nodes[i].size;
+    if (nodes[i].type == NODE_DIR) {
+      int dir_size = du_recursive(nodes, first_child, next_sibling, i);
+      kprintf("%d\t/%s\n", dir_size, nodes[i].name);
+      size += dir_size;
     }
+    total += size;
   }
 
-  int total = du_recursive(0);
   kprintf("%d\ttotal\n", total);
   kprintf("\n");
 }
@@ -285,32 +309,30 @@ void cmd_more(const char *args) {
     return;
   }
 
-  char buffer[4096];
-  int len = fs_read(args, buffer, 4095);
+  size_t len;
+  const uint8_t *buffer = fs_map(args, &len);
 
-  if (len < 0) {
+  if (!buffer) {
     kprintf("more: cannot open '%s'\n", args);
     return;
   }
 
-  buffer[len] = '\0';
-
   int lines = 0;
-  const char *p = buffer;
+  size_t i = 0;
 
-  while (*p) {
+  while (i < len) {
     /* Print one line */
-    while (*p && *p != '\n') {
-      kprintf("%c", *p++);
+    while (i < len && buffer[i] != '\n') {
+      vga_putchar(buffer[i++]);
     }
-    if (*p == '\n') {
+    if (i < len) {
       kprintf("\n");
-      p++;
+      i++;
       lines++;
     }
 
     /* Pause every 20 lines */
-    if (lines >= 20 && *p) {
+    if (lines >= 20 && i < len) {
       kprintf("--More-- (Press any key)");
       keyboard_getchar();
       kprintf("\r                        \r");
@@ -348,66 +370,68 @@ void cmd_diff(const char *args) {
     return;
   }
 
-  char buf1[4096], buf2[4096];
-  int len1 = fs_read(file1, buf1, 4095);
-  int len2 = fs_read(file2, buf2, 4095);
+  size_t len1, len2;
+  const uint8_t *buf1 = fs_map(file1, &len1);
+  const uint8_t *buf2 = fs_map(file2, &len2);
 
-  if (len1 < 0) {
+  if (!buf1) {
     kprintf("diff: %s: No such file\n", file1);
     return;
   }
-  if (len2 < 0) {
+  if (!buf2) {
     kprintf("diff: %s: No such file\n", file2);
     return;
   }
 
-  buf1[len1] = '\0';
-  buf2[len2] = '\0';
-
-  if (strcmp(buf1, buf2) == 0) {
-    kprintf("Files are identical\n");
-    return;
-  }
-
-  /* Simple line-by-line diff */
-  kprintf("\n");
-
-  const char *l1 = buf1, *l2 = buf2;
+  /* Single line-by-line pass; files are identical if no line differs */
+  size_t p1 = 0, p2 = 0;
   int line = 1;
+  int differ = 0;
 
-  while (*l1 || *l2) {
+  while (p1 < len1 || p2 < len2) {
     /* Get line from file1 */
-    char line1[256] = "";
-    i = 0;
-    while (*l1 && *l1 != '\n' && i < 255)
-      line1[i++] = *l1++;
-    line1[i] = '\0';
-    if (*l1 == '\n')
-      l1++;
+    size_t s1 = p1;
+    while (p1 < len1 && buf1[p1] != '\n')
+      p1++;
+    size_t n1 = p1 - s1;
+    if (p1 < len1)
+      p1++;
 
     /* Get line from file2 */
-    char line2[256] = "";
-    i = 0;
-    while (*l2 && *l2 != '\n' && i < 255)
-      line2[i++] = *l2++;
-    line2[i] = '\0';
-    if (*l2 == '\n')
-      l2++;
-
-    if (strcmp(line1, line2) != 0) {
+    size_t s2 = p2;
+    while (p2 < len2 && buf2[p2] != '\n')
+      p2++;
+    size_t n2 = p2 - s2;
+    if (p2 < len2)
+      p2++;
+
+    if (n1 != n2 || memcmp(buf1 + s1, buf2 + s2, n1) != 0) {
+      if (!differ) {
+        kprintf("\n");
+        differ = 1;
+      }
       kprintf("%dc%d\n", line, line);
       kprintf_color("< ", VGA_COLOR_RED);
-      kprintf("%s\n", line1);
-      kprintf("---\n");
+      for (size_t k = 0; k < n1; k++)
+        vga_putchar(buf1[s1 + k]);
+      kprintf("\n---\n");
       kprintf_color("> ", VGA_COLOR_GREEN);
-      kprintf("%s\n", line2);
+      for (size_t k = 0; k < n2; k++)
+        vga_putchar(buf2[s2 + k]);
+      kprintf("\n");
     }
 
     line++;
-    if (!*l1 && !*l2)
-      break;
   }
 
+  /* Equal lines can still hide a differing count of trailing newlines */
+  if (!differ && len1 == len2) {
+    kprintf("Files are identical\n");
+    return;
+  }
+  if (!differ)
+    kprintf("\nFiles differ only in trailing newlines\n");
+
   kprintf("\n");
 }
 
@@ -459,30 +483,28 @@ void cmd_cut(const char *args) {
   if (field < 1)
     field = 1;
 
-  char buffer[4096];
-  int len = 0;
-
-  if (filename[0]) {
-    len = fs_read(filename, buffer, 4095);
-    if (len < 0) {
-      kprintf("cut: %s: No such file\n", filename);
-      return;
-    }
-    buffer[len] = '\0';
-  } else {
+  if (!filename[0]) {
     kprintf("Usage: cut -d<delim> -f<field> <file>\n");
     return;
   }
 
+  size_t len;
+  const char *buffer = (const char *)fs_map(filename, &len);
+  if (!buffer) {
+    kprintf("cut: %s: No such file\n", filename);
+    return;
+  }
+  const char *buf_end = buffer + len;
+
   /* Process each line */
   const char *line = buffer;
-  while (*line) {
+  while (line < buf_end) {
     /* Find the requested field */
     int current_field = 1;
     const char *field_start = line;
     const char *field_end = line;
 
-    while (*field_end && *field_end != '\n') {
+    while (field_end < buf_end && *field_end != '\n') {
       if (*field_end == delim) {
         if (current_field == field)
           break;
@@ -495,19 +517,19 @@ void cmd_cut(const char *args) {
     if (current_field == field) {
       /* Print the field */
       const char *end = field_end;
-      if (*end == delim)
+      if (end < buf_end && *end == delim)
         end--;
-      while (field_start <= end && *field_start != delim &&
-             *field_start != '\n') {
-        kprintf("%c", *field_start++);
+      while (field_start <= end && field_start < buf_end &&
+             *field_start != delim && *field_start != '\n') {
+        vga_putchar(*field_start++);
       }
       kprintf("\n");
     }
 
     /* Move to next line */
-    while (*line && *line != '\n')
+    while (line < buf_end && *line != '\n')
       line++;
-    if (*line == '\n')
+    if (line < buf_end)
       line++;
   }
 }
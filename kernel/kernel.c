@@ -299,6 +299,20 @@ void kernel_panic(const char *message) {
   }
 }
 
+/*
+ * Printf output buffering - characters are handed to the VGA driver in
+ * chunks so the hardware cursor is moved once per chunk, not per character
+ */
+#define KPRINTF_BUF 128
+
+static void kprintf_emit(char *out, int *len, char c) {
+  out[(*len)++] = c;
+  if (*len == KPRINTF_BUF) {
+    vga_write(out, *len);
+    *len = 0;
+  }
+}
+
 /*
  * Printf implementation
  */
@@ -306,6 +320,9 @@ void kprintf(const char *fmt, ...) {
   va_list args;
   va_start(args, fmt);
 
+  char out[KPRINTF_BUF];
+  int out_len = 0;
+
   while (*fmt) {
     if (*fmt == '%') {
       fmt++;
@@ -313,7 +330,7 @@ void kprintf(const char *fmt, ...) {
       case 's': {
         const char *s = va_arg(args, const char *);
         while (*s)
-          vga_putchar(*s++);
+          kprintf_emit(out, &out_len, *s++);
         break;
       }
       case 'd': {
@@ -333,9 +350,9 @@ void kprintf(const char *fmt, ...) {
           n /= 10;
         }
         if (neg)
-          vga_putchar('-');
+          kprintf_emit(out, &out_len, '-');
         while (i > 0)
-          vga_putchar(buf[--i]);
+          kprintf_emit(out, &out_len, buf[--i]);
         break;
       }
       case 'x': {
@@ -343,7 +360,7 @@ void kprintf(const char *fmt, ...) {
         char hex[16];
         int i = 0;
         if (n == 0) {
-          vga_putchar('0');
+          kprintf_emit(out, &out_len, '0');
           break;
         }
         while (n > 0) {
@@ -352,22 +369,25 @@ void kprintf(const char *fmt, ...) {
           n >>= 4;
         }
         while (i > 0)
-          vga_putchar(hex[--i]);
+          kprintf_emit(out, &out_len, hex[--i]);
         break;
       }
       case 'c':
-        vga_putchar((char)va_arg(args, int));
+        kprintf_emit(out, &out_len, (char)va_arg(args, int));
         break;
       case '%':
-        vga_putchar('%');
+        kprintf_emit(out, &out_len, '%');
         break;
       }
       fmt++;
     } else {
-      vga_putchar(*fmt++);
+      kprintf_emit(out, &out_len, *fmt++);
     }
   }
 
+  if (out_len > 0)
+    vga_write(out, out_len);
+
   va_end(args);
 }
 
@@ -112,6 +112,7 @@ static inline void io_wait(void) { outb(0x80, 0); }
 void vga_init(void);
 void vga_clear(void);
 void vga_putchar(char c);
+void vga_write(const char *data, size_t len);
 void vga_puts(const char *str);
 void vga_set_color(vga_color_t color);
 vga_color_t vga_get_color(void);
@@ -214,7 +215,9 @@ void cpu_detect(void);
 
 int fs_init(void);
 int fs_write(const char *name, const char *data, size_t len);
+int fs_append(const char *name, const char *data, size_t len);
 int fs_read(const char *name, char *buf, size_t max);
+const uint8_t *fs_map(const char *name, size_t *len);
 
 void cmd_ls(const char *args);
 void cmd_cat(const char *args);
@@ -305,6 +308,7 @@ void cmd_play(const char *args);
  * RTC (Real Time Clock)
  * ============================================ */
 
+uint32_t rtc_get_seconds(void);
 void cmd_date_rtc(const char *args);
 void cmd_time(const char *args);
 void cmd_cal(const char *args);
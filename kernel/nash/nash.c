@@ -59,6 +59,26 @@ extern int fs_read(const char *name, char *buf, size_t max);
 #define MAX_VAR_NAME 32
 #define MAX_VAR_VALUE 256
 #define MAX_SCRIPT_SIZE 8192
+#define MAX_SCRIPT_LINES 1024
+
+/* Statement kinds, resolved once when the script is loaded */
+#define NASH_END 0
+#define NASH_OTHERWISE 1
+#define NASH_ASSIGN 2
+#define NASH_PRINT 3
+#define NASH_SHOW 4
+#define NASH_WHEN 5
+#define NASH_REPEAT 6
+#define NASH_RUN 7
+#define NASH_COMMAND 8
+
+typedef struct {
+  const char *text; /* Statement text, leading whitespace stripped */
+  uint8_t kind;
+} nash_line_t;
+
+static nash_line_t nash_lines[MAX_SCRIPT_LINES];
+static int nash_running = 0; /* nash_lines belongs to the running script */
 
 typedef struct {
   char name[MAX_VAR_NAME];
@@ -147,14 +167,35 @@ static int starts_with(const char *line, const char *keyword) {
 }
 
 /*
- * Parse and execute Nash script
+ * Classify a statement by its leading keyword
  */
-static void nash_execute_script(const char *script) {
-  char line[512];
-  const char *p = script;
-  int in_when = 0, skip_block = 0;
-  int repeat_count = 0;
-  const char *repeat_start = NULL;
+static uint8_t nash_classify(const char *l) {
+  if (starts_with(l, "end"))
+    return NASH_END;
+  if (starts_with(l, "otherwise"))
+    return NASH_OTHERWISE;
+  if (*l == '@')
+    return NASH_ASSIGN;
+  if (starts_with(l, "print"))
+    return NASH_PRINT;
+  if (starts_with(l, "show"))
+    return NASH_SHOW;
+  if (starts_with(l, "when"))
+    return NASH_WHEN;
+  if (starts_with(l, "repeat"))
+    return NASH_REPEAT;
+  if (starts_with(l, "run"))
+    return NASH_RUN;
+  return NASH_COMMAND;
+}
+
+/*
+ * Split script into statements in place (newlines become terminators),
+ * dropping blank lines and comments. Returns statement count.
+ */
+static int nash_compile(char *script, nash_line_t *lines, int max) {
+  char *p = script;
+  int count = 0;
 
   while (*p) {
     /* Skip leading whitespace */
@@ -162,16 +203,13 @@ static void nash_execute_script(const char *script) {
       p++;
 
     /* Get a line */
-    int i = 0;
-    while (*p && *p != '\n' && i < 511) {
-      line[i++] = *p++;
-    }
-    line[i] = '\0';
-    if (*p == '\n')
+    char *l = p;
+    while (*p && *p != '\n')
       p++;
+    if (*p == '\n')
+      *p++ = '\0';
 
     /* Skip empty lines and comments (-- or ::) */
-    const char *l = skip_ws(line);
     if (*l == '\0')
       continue;
     if (l[0] == '-' && l[1] == '-')
@@ -179,14 +217,38 @@ static void nash_execute_script(const char *script) {
     if (l[0] == ':' && l[1] == ':')
       continue;
 
+    if (count == max) {
+      kprintf("nash: script too long, truncated at %d statements\n", max);
+      break;
+    }
+    lines[count].text = l;
+    lines[count].kind = nash_classify(l);
+    count++;
+  }
+
+  return count;
+}
+
+/*
+ * Execute a compiled Nash script
+ */
+static void nash_execute_script(const nash_line_t *lines, int count) {
+  int in_when = 0, skip_block = 0;
+  int repeat_count = 0;
+  int repeat_start = -1;
+
+  for (int pc = 0; pc < count; pc++) {
+    const char *l = lines[pc].text;
+    uint8_t kind = lines[pc].kind;
+
     /* Handle: end */
-    if (starts_with(l, "end")) {
-      if (repeat_count > 0 && repeat_start) {
+    if (kind == NASH_END) {
+      if (repeat_count > 0 && repeat_start >= 0) {
         repeat_count--;
         if (repeat_count > 0) {
-          p = repeat_start;
+          pc = repeat_start - 1;
         } else {
-          repeat_start = NULL;
+          repeat_start = -1;
         }
       }
       in_when = 0;
@@ -195,7 +257,7 @@ static void nash_execute_script(const char *script) {
     }
 
     /* Handle: otherwise */
-    if (starts_with(l, "otherwise")) {
+    if (kind == NASH_OTHERWISE) {
       if (in_when)
         skip_block = !skip_block;
       continue;
@@ -205,7 +267,7 @@ static void nash_execute_script(const char *script) {
       continue;
 
     /* Handle: @var = "value" or @var = value */
-    if (*l == '@') {
+    if (kind == NASH_ASSIGN) {
       const char *v = l + 1;
       char varname[MAX_VAR_NAME];
       int j = 0;
@@ -241,7 +303,7 @@ static void nash_execute_script(const char *script) {
     }
 
     /* Handle: print "text" or print @var */
-    if (starts_with(l, "print")) {
+    if (kind == NASH_PRINT) {
       const char *msg = skip_ws(l + 5);
       char expanded[512];
 
@@ -263,7 +325,7 @@ static void nash_execute_script(const char *script) {
     }
 
     /* Handle: show @var */
-    if (starts_with(l, "show")) {
+    if (kind == NASH_SHOW) {
       const char *var = skip_ws(l + 4);
       if (*var == '@') {
         var++;
@@ -279,7 +341,7 @@ static void nash_execute_script(const char *script) {
     }
 
     /* Handle: when <cond> do */
-    if (starts_with(l, "when")) {
+    if (kind == NASH_WHEN) {
       in_when = 1;
       const char *cond = skip_ws(l + 4);
 
@@ -342,7 +404,7 @@ static void nash_execute_script(const char *script) {
     }
 
     /* Handle: repeat <n> times */
-    if (starts_with(l, "repeat")) {
+    if (kind == NASH_REPEAT) {
       const char *n = skip_ws(l + 6);
       char num[16];
       int j = 0;
@@ -355,12 +417,12 @@ static void nash_execute_script(const char *script) {
       for (j = 0; num[j]; j++) {
         repeat_count = repeat_count * 10 + (num[j] - '0');
       }
-      repeat_start = p;
+      repeat_start = pc + 1;
       continue;
     }
 
     /* Handle: run <command> (execute shell command) */
-    if (starts_with(l, "run")) {
+    if (kind == NASH_RUN) {
       const char *cmd = skip_ws(l + 3);
       char expanded[512];
       nash_expand(cmd, expanded, 512);
@@ -410,6 +472,11 @@ void cmd_nash(const char *args) {
     return;
   }
 
+  if (nash_running) {
+    kprintf("nash: cannot run a script from inside a script\n");
+    return;
+  }
+
   /* Read script */
   char script[MAX_SCRIPT_SIZE];
   int len = fs_read(args, script, MAX_SCRIPT_SIZE - 1);
@@ -429,7 +496,10 @@ void cmd_nash(const char *args) {
   nash_set_var("shell", "nash");
   nash_set_var("version", "2.0");
 
-  nash_execute_script(script);
+  nash_running = 1;
+  int count = nash_compile(script, nash_lines, MAX_SCRIPT_LINES);
+  nash_execute_script(nash_lines, count);
+  nash_running = 0;
 }
 
 void cmd_nash_vars(const char *args) {
@@ -14,7 +14,7 @@
 typedef struct {
   uint32_t ip;
   uint8_t mac[6];
-  uint32_t timestamp;
+  uint32_t timestamp; /* rtc_get_seconds() when learned */
   uint8_t valid;
 } arp_entry_t;
 
@@ -50,6 +50,11 @@ void net_get_mac(uint8_t *mac) { memcpy(mac, our_mac, 6); }
 int arp_lookup(uint32_t ip, uint8_t *mac) {
   for (int i = 0; i < ARP_CACHE_SIZE; i++) {
     if (arp_cache[i].valid && arp_cache[i].ip == ip) {
+      /* Stale mapping - force a fresh ARP request */
+      if (rtc_get_seconds() - arp_cache[i].timestamp > ARP_TIMEOUT) {
+        arp_cache[i].valid = 0;
+        return -1;
+      }
       memcpy(mac, arp_cache[i].mac, 6);
       return 0;
     }
@@ -65,7 +70,7 @@ void arp_add(uint32_t ip, const uint8_t *mac) {
   for (int i = 0; i < ARP_CACHE_SIZE; i++) {
     if (arp_cache[i].valid && arp_cache[i].ip == ip) {
       memcpy(arp_cache[i].mac, mac, 6);
-      arp_cache[i].timestamp = timer_get_ticks();
+      arp_cache[i].timestamp = rtc_get_seconds();
       return;
     }
   }
@@ -87,7 +92,7 @@ void arp_add(uint32_t ip, const uint8_t *mac) {
 
   arp_cache[oldest].ip = ip;
   memcpy(arp_cache[oldest].mac, mac, 6);
-  arp_cache[oldest].timestamp = timer_get_ticks();
+  arp_cache[oldest].timestamp = rtc_get_seconds();
   arp_cache[oldest].valid = 1;
 }
 
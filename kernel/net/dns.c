@@ -16,7 +16,79 @@ static uint32_t dns_server = 0x08080808; /* 8.8.8.8 Google DNS */
 #define DNS_FLAG_RD 0x0100
 #define DNS_FLAG_RA 0x0080
 
-void dns_set_server(uint32_t ip) { dns_server = ip; }
+/* Resolver cache */
+#define DNS_CACHE_SIZE 16
+#define DNS_CACHE_NAME 64
+#define DNS_CACHE_MAX_TTL 300 /* Cap record TTL at 5 minutes */
+
+typedef struct {
+  char name[DNS_CACHE_NAME];
+  uint32_t ip;
+  uint32_t added;     /* rtc_get_seconds() when cached */
+  uint32_t ttl;       /* Seconds the answer stays valid */
+  uint32_t last_used; /* dns_use_clock at last hit, for LRU replacement */
+  uint8_t valid;
+} dns_cache_entry_t;
+
+static dns_cache_entry_t dns_cache[DNS_CACHE_SIZE];
+static uint32_t dns_use_clock = 0; /* Bumped on every cache hit or insert */
+
+/*
+ * Look up hostname in resolver cache
+ */
+static int dns_cache_lookup(const char *hostname, uint32_t *ip) {
+  for (int i = 0; i < DNS_CACHE_SIZE; i++) {
+    if (dns_cache[i].valid && strcmp(dns_cache[i].name, hostname) == 0) {
+      /* Unsigned age: a clock that went backwards also counts as expired */
+      if (rtc_get_seconds() - dns_cache[i].added >= dns_cache[i].ttl) {
+        dns_cache[i].valid = 0;
+        return -1;
+      }
+      dns_cache[i].last_used = ++dns_use_clock;
+      *ip = dns_cache[i].ip;
+      return 0;
+    }
+  }
+  return -1;
+}
+
+/*
+ * Add resolved address to cache (TTL in seconds)
+ */
+static void dns_cache_add(const char *hostname, uint32_t ip, uint32_t ttl) {
+  if (ttl == 0 || strlen(hostname) >= DNS_CACHE_NAME)
+    return;
+  if (ttl > DNS_CACHE_MAX_TTL)
+    ttl = DNS_CACHE_MAX_TTL;
+
+  /* Find empty or least recently used slot */
+  int slot = 0;
+  uint32_t oldest_time = 0xFFFFFFFF;
+
+  for (int i = 0; i < DNS_CACHE_SIZE; i++) {
+    if (!dns_cache[i].valid) {
+      slot = i;
+      break;
+    }
+    if (dns_cache[i].last_used < oldest_time) {
+      oldest_time = dns_cache[i].last_used;
+      slot = i;
+    }
+  }
+
+  strcpy(dns_cache[slot].name, hostname);
+  dns_cache[slot].ip = ip;
+  dns_cache[slot].added = rtc_get_seconds();
+  dns_cache[slot].ttl = ttl;
+  dns_cache[slot].last_used = ++dns_use_clock;
+  dns_cache[slot].valid = 1;
+}
+
+void dns_set_server(uint32_t ip) {
+  dns_server = ip;
+  /* Answers from the old server no longer apply */
+  memset(dns_cache, 0, sizeof(dns_cache));
+}
 
 uint32_t dns_get_server(void) { return dns_server; }
 
@@ -54,6 +126,9 @@ static size_t dns_encode_name(const char *name, uint8_t *buffer) {
  * DNS lookup
  */
 int dns_lookup(const char *hostname, uint32_t *ip) {
+  if (dns_cache_lookup(hostname, ip) == 0)
+    return 0;
+
   uint8_t query[512];
   uint8_t response[512];
 
@@ -154,7 +229,10 @@ int dns_lookup(const char *hostname, uint32_t *ip) {
     uint16_t rtype = (response[pos] << 8) | response[pos + 1];
     pos += 2;
     pos += 2; /* Skip class */
-    pos += 4; /* Skip TTL */
+    uint32_t ttl = ((uint32_t)response[pos] << 24) |
+                   ((uint32_t)response[pos + 1] << 16) |
+                   ((uint32_t)response[pos + 2] << 8) | response[pos + 3];
+    pos += 4;
 
     uint16_t rdlen = (response[pos] << 8) | response[pos + 1];
     pos += 2;
@@ -163,6 +241,7 @@ int dns_lookup(const char *hostname, uint32_t *ip) {
       *ip = ((uint32_t)response[pos] << 24) |
             ((uint32_t)response[pos + 1] << 16) |
             ((uint32_t)response[pos + 2] << 8) | response[pos + 3];
+      dns_cache_add(hostname, *ip, ttl);
       return 0;
     }
 
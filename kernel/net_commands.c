@@ -16,6 +16,7 @@ void cmd_nifconfig(const char *args) {
     net_get_mac(mac);
     uint32_t ip = net_get_ip();
     uint32_t gw = net_get_gateway();
+    uint32_t dns = dns_get_server();
 
     kprintf("\neth0:\n");
     kprintf("  MAC:     %02x:%02x:%02x:%02x:%02x:%02x\n", mac[0], mac[1],
@@ -24,9 +25,8 @@ void cmd_nifconfig(const char *args) {
             (ip >> 8) & 0xFF, ip & 0xFF);
     kprintf("  Gateway: %d.%d.%d.%d\n", (gw >> 24) & 0xFF, (gw >> 16) & 0xFF,
             (gw >> 8) & 0xFF, gw & 0xFF);
-    kprintf("  DNS:     %d.%d.%d.%d\n", (dns_get_server() >> 24) & 0xFF,
-            (dns_get_server() >> 16) & 0xFF, (dns_get_server() >> 8) & 0xFF,
-            dns_get_server() & 0xFF);
+    kprintf("  DNS:     %d.%d.%d.%d\n", (dns >> 24) & 0xFF, (dns >> 16) & 0xFF,
+            (dns >> 8) & 0xFF, dns & 0xFF);
     kprintf("\n");
     return;
   }
@@ -40,25 +40,6 @@ static int pipe_atoi(const char *s) {
   return neg ? -n : n;
 }
 
-/*
- * Simple strstr implementation
- */
-static char *pipe_strstr(const char *haystack, const char *needle) {
-  if (!*needle)
-    return (char *)haystack;
-  for (; *haystack; haystack++) {
-    const char *h = haystack;
-    const char *n = needle;
-    while (*h && *n && *h == *n) {
-      h++;
-      n++;
-    }
-    if (!*n)
-      return (char *)haystack;
-  }
-  return NULL;
-}
-
 /*
  * Capture output to pipe buffer instead of screen
  */
@@ -249,29 +230,33 @@ static int execute_with_pipe_input(const char *cmd, const char *input) {
   }
 
   if (strcmp(command, "grep") == 0) {
-    /* Simple grep on piped input */
+    /* Simple grep on piped input, matched in place without line copies */
     const char *pattern = args;
+    if (!pattern[0])
+      return 1;
+
+    int pat_len = strlen(pattern);
     const char *line_start = input;
+    const char *p = input;
 
-    while (*line_start) {
-      const char *line_end = line_start;
+    while (*p) {
+      if (*p == '\n') {
+        line_start = ++p;
+        continue;
+      }
+      if (*p != pattern[0] || memcmp(p, pattern, pat_len) != 0) {
+        p++;
+        continue;
+      }
+
+      const char *line_end = p;
       while (*line_end && *line_end != '\n')
         line_end++;
+      vga_write(line_start, line_end - line_start);
+      vga_putchar('\n');
 
-      /* Check if pattern in line */
-      char line[256];
-      int len = line_end - line_start;
-      if (len > 255)
-        len = 255;
-      memcpy(line, line_start, len);
-      line[len] = '\0';
-
-      /* Simple substring search */
-      if (pattern[0] && pipe_strstr(line, pattern)) {
-        kprintf("%s\n", line);
-      }
-
-      line_start = *line_end ? line_end + 1 : line_end;
+      /* Resume at the newline so line_start is updated for the next line */
+      p = line_end;
     }
     return 1;
   }
@@ -300,23 +285,17 @@ static int execute_with_pipe_input(const char *cmd, const char *input) {
     if (n <= 0)
       n = 10;
 
-    /* Count total lines */
-    int total = 0;
-    for (const char *p = input; *p; p++) {
-      if (*p == '\n')
-        total++;
-    }
-
-    /* Skip to last n lines */
-    int skip = total - n;
-    if (skip < 0)
-      skip = 0;
+    /* Walk back from the end to the start of the Nth-from-last line */
+    int end = strlen(input);
+    if (end > 0 && input[end - 1] == '\n')
+      end--; /* Trailing newline does not start another line */
 
+    const char *p = input + end;
     int lines = 0;
-    const char *p = input;
-    while (*p && lines < skip) {
-      if (*p++ == '\n')
-        lines++;
+    while (p > input) {
+      if (p[-1] == '\n' && ++lines >= n)
+        break;
+      p--;
     }
     kprintf("%s", p);
     return 1;
@@ -389,19 +368,19 @@ static int execute_with_pipe_input(const char *cmd, const char *input) {
  * Main shell execute with full operator support
  */
 void shell_execute_advanced(const char *input) {
-  char cmdline[512];
-  strncpy(cmdline, input, 511);
-  cmdline[511] = '\0';
-
   int pos = 0;
-  int op = find_operator(cmdline, &pos);
+  int op = find_operator(input, &pos);
 
   if (op == 0) {
-    /* Simple command */
-    shell_execute_simple(cmdline);
+    /* Simple command - dispatch directly, no copy needed */
+    shell_execute_simple(input);
     return;
   }
 
+  char cmdline[512];
+  strncpy(cmdline, input, 511);
+  cmdline[511] = '\0';
+
   /* Split at operator */
   char left[256], right[256];
   memcpy(left, cmdline, pos);
@@ -429,23 +408,11 @@ void shell_execute_advanced(const char *input) {
     break;
 
   case 3: /* Append: cmd >> file */
-  {
-    char existing[4096] = "";
-    int existing_len = fs_read(right, existing, 4095);
-    if (existing_len < 0)
-      existing_len = 0;
-
     pipe_capture_start();
     shell_execute_simple(left);
     pipe_capture_end();
-
-    /* Append new content */
-    if (existing_len + pipe_buffer_len < 4095) {
-      memcpy(existing + existing_len, pipe_buffer, pipe_buffer_len);
-      existing_len += pipe_buffer_len;
-    }
-    fs_write(right, existing, existing_len);
-  } break;
+    fs_append(right, pipe_get_buffer(), pipe_buffer_len);
+    break;
 
   case 4: /* Input: cmd < file */
   {
@@ -28,13 +28,17 @@ typedef struct {
 } cpu_info_t;
 
 static cpu_info_t cpu_info;
+static int cpu_detected = 0;
 
 /*
- * Detect CPU information
+ * Detect CPU information (once - CPUID results never change)
  */
 void cpu_detect(void) {
   uint32_t eax, ebx, ecx, edx;
 
+  if (cpu_detected)
+    return;
+
   /* Get vendor string */
   cpuid(0, &eax, &ebx, &ecx, &edx);
   *((uint32_t *)&cpu_info.vendor[0]) = ebx;
@@ -77,6 +81,8 @@ void cpu_detect(void) {
   } else {
     strcpy(cpu_info.brand, "Unknown");
   }
+
+  cpu_detected = 1;
 }
 
 /*